@@ -1,12 +1,24 @@
 #!/usr/bin/env python3
 """Record all BasementUI examples as asciicast files and convert to GIF."""
 
+import codecs
+import concurrent.futures
+import fcntl
+import hashlib
+import io
 import json
 import os
+import pty
+import queue
+import selectors
+import shutil
+import signal
+import struct
 import subprocess
 import sys
+import termios
+import threading
 import time
-import pexpect
 
 PROJ_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 GO_DIR = os.path.join(PROJ_DIR, "go")
@@ -17,6 +29,11 @@ DEFAULT_ROWS = 15
 LARGE_COLS= 80
 LARGE_ROWS = 40
 
+# Cast compression: longest idle gap kept between events, and the rate
+# events are bucketed down to before writing
+IDLE_CAP = 0.5
+FRAME_HZ = 30
+
 # ANSI escape sequences for arrow keys
 UP = "\x1b[A"
 DOWN = "\x1b[B"
@@ -27,104 +44,327 @@ ENTER = "\r"
 BACKSPACE = "\x7f"
 
 
-def build_example(name, command):
-    """Pre-build example binary for instant startup."""
-    os.makedirs(BIN_DIR, exist_ok=True)
-    bin_path = os.path.join(BIN_DIR, name)
-
-    # Extract the source path and build tags from the go run command
-    parts = command.split()
-    tags = ""
-    src = parts[-1]  # Last arg is the source path
-    if "-tags" in command:
-        idx = parts.index("-tags")
-        tags = f"-tags {parts[idx+1]}"
-
-    build_cmd = f"cd {GO_DIR} && go build {tags} -o {bin_path} {src}"
-    print(f"  Building {name}...")
-    ret = os.system(build_cmd + " 2>&1")
-    if ret != 0:
-        print(f"  ERROR: Build failed for {name}")
-        return None
-    return bin_path
-
-
-def record_cast(name, bin_path, actions, cols=DEFAULT_COLS, rows=DEFAULT_ROWS):
-    """
-    Record an asciicast v2 file by running the pre-built binary.
+def build_examples(targets):
+    """Pre-build all example binaries for instant startup.
 
-    actions: list of tuples (delay_seconds, keys_to_send_or_None)
+    Packages are grouped by their `-tags` value and each group is compiled
+    with a single `go build` invocation, so the toolchain startup, module
+    load and build cache are shared across all examples instead of paid
+    once per binary.
     """
-    cast_path = os.path.join(EXAMPLES_DIR, f"{name}.cast")
+    os.makedirs(BIN_DIR, exist_ok=True)
+
+    # tags value -> list of (name, package path)
+    groups = {}
+    for name in targets:
+        parts = EXAMPLES[name]["command"].split()
+        tags = ""
+        src = parts[-1]  # Last arg is the source path
+        if "-tags" in parts:
+            tags = parts[parts.index("-tags") + 1]
+        # go build names the output after the package directory
+        pkg = "./" + os.path.dirname(src)
+        groups.setdefault(tags, []).append((name, pkg))
+
+    bin_paths = {}
+    for tags, members in groups.items():
+        cmd = ["go", "build"]
+        if tags:
+            cmd += ["-tags", tags]
+        cmd += ["-o", BIN_DIR + os.sep]
+        cmd += [pkg for _, pkg in members]
+
+        print(f"  Building {', '.join(name for name, _ in members)}...")
+        # One build graph per group; let go compile its packages in parallel
+        result = subprocess.run(
+            cmd,
+            cwd=GO_DIR,
+            env=dict(os.environ, GOFLAGS=f"-p={os.cpu_count() or 1}"),
+        )
+        if result.returncode != 0:
+            print(f"  ERROR: Build failed (tags={tags or 'none'})")
+            continue
+
+        for name, pkg in members:
+            bin_path = os.path.join(BIN_DIR, os.path.basename(pkg))
+            if os.path.exists(bin_path):
+                bin_paths[name] = bin_path
+            else:
+                print(f"  ERROR: No binary produced for {name}")
+    return bin_paths
 
-    print(f"  Recording {name}...")
 
-    # Start the pre-built binary in a PTY
-    child = pexpect.spawn(
+def spawn_example(bin_path, cols=DEFAULT_COLS, rows=DEFAULT_ROWS):
+    """Start a pre-built example binary attached to a fresh PTY.
+
+    Spawns via os.posix_spawn (vfork-backed in glibc) rather than
+    fork+exec, so launching does not copy the interpreter's page tables.
+
+    Returns (pid, master_fd).
+    """
+    master, slave = pty.openpty()
+    fcntl.ioctl(slave, termios.TIOCSWINSZ, struct.pack("HHHH", rows, cols, 0, 0))
+    pid = os.posix_spawn(
         bin_path,
-        encoding=None,  # binary mode
-        dimensions=(rows, cols),
-        timeout=30,
+        [bin_path],
+        dict(os.environ, TERM="xterm-256color"),
+        file_actions=[
+            (os.POSIX_SPAWN_DUP2, slave, 0),
+            (os.POSIX_SPAWN_DUP2, slave, 1),
+            (os.POSIX_SPAWN_DUP2, slave, 2),
+        ],
+        setsid=True,
     )
+    os.close(slave)
+    # Non-blocking master: drain loops read until BlockingIOError
+    # instead of re-checking readiness before every read
+    flags = fcntl.fcntl(master, fcntl.F_GETFL)
+    fcntl.fcntl(master, fcntl.F_SETFL, flags | os.O_NONBLOCK)
+    return pid, master
 
-    # Collect output events: (timestamp, "o", data)
-    events = []
-    start_time = time.time()
 
-    def capture_output(wait=0.1):
-        """Read any available output from the child."""
-        try:
-            while True:
-                data = child.read_nonblocking(size=16384, timeout=wait)
-                if data:
-                    t = time.time() - start_time
-                    events.append((t, "o", data.decode("utf-8", errors="replace")))
-                    wait = 0.005  # Capture more frames (was 0.01)
-        except (pexpect.TIMEOUT, pexpect.EOF):
-            pass
+def _write_whole(path, buf):
+    """Write an assembled byte buffer to `path` in one write syscall."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, buf)
+    finally:
+        os.close(fd)
 
-    # Wait for initial render
-    time.sleep(0.1)
-    capture_output(wait=0.05)
 
-    # Execute the scripted actions
-    for action in actions:
-        if isinstance(action, tuple):
-            delay, keys = action
-            if delay > 0:
-                time.sleep(delay)
-                capture_output()
-            if keys is not None:
-                if isinstance(keys, bytes):
-                    child.send(keys)
-                else:
-                    child.send(keys.encode("utf-8"))
-                time.sleep(0.05)
-                capture_output()
-
-    # Wait for process to exit
-    try:
-        child.expect(pexpect.EOF, timeout=3)
-        final_data = child.before
-        if final_data:
-            t = time.time() - start_time
-            events.append((t, "o", final_data.decode("utf-8", errors="replace")))
-    except (pexpect.TIMEOUT, pexpect.EOF):
-        child.terminate(force=True)
-
-    # Write asciicast v2 file
+def ttyrec_to_cast(ttyrec_path, cast_path, header):
+    """Convert a binary capture to asciicast v2 in a single pass.
+
+    Each frame is `struct.pack("<dI", t, len(data)) + data`; decoding
+    and JSON serialization happen here, once, instead of per frame in
+    the capture hot loop.
+    """
+    dec = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    buf = bytearray((json.dumps(header) + "\n").encode("utf-8"))
+    with open(ttyrec_path, "rb") as src:
+        while True:
+            frame = src.read(12)
+            if len(frame) < 12:
+                break
+            t, size = struct.unpack("<dI", frame)
+            text = dec.decode(src.read(size))
+            if text:
+                buf += (json.dumps([round(t, 6), "o", text]) + "\n").encode("utf-8")
+        tail = dec.decode(b"", final=True)
+        if tail:
+            buf += (json.dumps([round(t, 6), "o", tail]) + "\n").encode("utf-8")
+    _write_whole(cast_path, buf)
+
+
+def compress_cast(cast_path):
+    """Collapse idle gaps and redundant frames in a recorded cast.
+
+    Walks the event stream once: inter-event delays above IDLE_CAP are
+    capped (all later timestamps shift down by the excess), events whose
+    payload repeats the previous one are dropped (full-screen redraws of
+    unchanged content), and events landing in the same 1/FRAME_HZ s
+    window are merged into one. The multi-second scripted waits shrink
+    to IDLE_CAP, so agg has far fewer and shorter frames to render.
+    """
+    with open(cast_path) as f:
+        lines = f.readlines()
+    if len(lines) < 2:
+        return
+    header = lines[0]
+    events = [json.loads(line) for line in lines[1:]]
+
+    out = []
+    shift = 0.0
+    last_t = 0.0
+    prev_data = None
+    for t, etype, data in events:
+        t -= shift
+        gap = t - last_t
+        if gap > IDLE_CAP:
+            shift += gap - IDLE_CAP
+            t = last_t + IDLE_CAP
+        last_t = t
+        if data == prev_data:
+            continue
+        prev_data = data
+        if out and int(t * FRAME_HZ) == int(out[-1][0] * FRAME_HZ):
+            out[-1][2] += data
+        else:
+            out.append([t, etype, data])
+
+    buf = bytearray(header.encode("utf-8"))
+    for t, etype, data in out:
+        buf += (json.dumps([round(t, 6), etype, data]) + "\n").encode("utf-8")
+    _write_whole(cast_path, buf)
+
+
+def record_cast(name, pid, master, actions, cols=DEFAULT_COLS, rows=DEFAULT_ROWS):
+    """
+    Record an asciicast v2 file from an already-spawned example child.
+
+    actions: list of tuples (delay_seconds, keys_to_send_or_None)
+    """
+    cast_path = os.path.join(EXAMPLES_DIR, f"{name}.cast")
+
+    print(f"  Recording {name}...")
+
+    # Wall clock only for the header; event timestamps come from the
+    # monotonic clock (returns an int, no float allocation per call,
+    # immune to wall-clock jumps mid-recording)
+    start_ns = time.monotonic_ns()
+
     header = {
         "version": 2,
         "width": cols,
         "height": rows,
-        "timestamp": int(start_time),
+        "timestamp": int(time.time()),
         "env": {"SHELL": "/bin/bash", "TERM": "xterm-256color"},
     }
 
-    with open(cast_path, "w") as f:
+    # Stream each event to disk as it is captured: memory stays O(one
+    # frame) and the capture is already on disk if the run dies midway.
+    # The 64 KiB buffer amortizes the per-event writes.
+    #
+    # With FAST_BINARY=1 the hot loop writes ttyrec-style binary frames
+    # (timestamp + length + raw payload, ~10x cheaper than json.dumps
+    # per frame) and the asciicast is produced in one pass at the end.
+    fast_binary = os.environ.get("FAST_BINARY") == "1"
+    if fast_binary:
+        ttyrec_path = os.path.join(EXAMPLES_DIR, f"{name}.ttyrec")
+        f = open(ttyrec_path, "wb", buffering=1 << 16)
+    else:
+        f = open(cast_path, "w", buffering=1 << 16)
         f.write(json.dumps(header) + "\n")
-        for t, etype, data in events:
-            f.write(json.dumps([round(t, 6), etype, data]) + "\n")
+
+    # Watch the PTY fd with epoll (via DefaultSelector) instead of
+    # pexpect's read_nonblocking, which arms a SIGALRM timer per read.
+    sel = selectors.DefaultSelector()
+    sel.register(master, selectors.EVENT_READ)
+    eof = False
+
+    # One preallocated read buffer for the whole recording: readinto
+    # fills it in place instead of allocating a fresh bytes object per
+    # read; bytes are sliced out only when an event is built
+    fio = io.FileIO(master, "rb", closefd=False)
+    read_buf = bytearray(4096)
+    read_mv = memoryview(read_buf)
+
+    # One incremental decoder for the whole recording: multi-byte UTF-8
+    # sequences split across PTY reads decode correctly instead of
+    # turning into replacement characters at chunk boundaries.
+    dec = codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+    if fast_binary:
+        def emit(t_ns, data):
+            f.write(struct.pack("<dI", t_ns / 1e9, len(data)) + data)
+    else:
+        def emit(t_ns, data):
+            text = dec.decode(data)
+            if text:
+                f.write(json.dumps([round(t_ns / 1e9, 6), "o", text]) + "\n")
+
+    def capture_output(wait=0.1):
+        """Drain any available output from the child's PTY.
+
+        Each drain cycle reads at most 8 x 4 KiB (the kernel TTY buffer
+        is 4 KiB) and timestamps the accumulated data once, so a fast
+        writer can neither starve the loop nor fragment one burst of
+        output into many tiny events. A short read means the PTY is
+        drained; a full 8th read re-enters via the outer select.
+        """
+        nonlocal eof
+        while not eof:
+            if not sel.select(timeout=wait):
+                return
+            chunks = []
+            for _ in range(8):
+                try:
+                    n = fio.readinto(read_mv)
+                except OSError:
+                    # EIO means the slave side of the PTY was closed
+                    n = 0
+                if n is None:
+                    # EAGAIN: nothing left to drain
+                    break
+                if n == 0:
+                    eof = True
+                    break
+                chunks.append(bytes(read_mv[:n]))
+                if n < len(read_buf):
+                    break
+            if chunks:
+                emit(time.monotonic_ns() - start_ns, b"".join(chunks))
+            wait = 0.005  # Capture more frames (was 0.01)
+
+    def capture_until(deadline):
+        """Capture frames until monotonic `deadline`, waking on data."""
+        remaining = deadline - time.monotonic()
+        while remaining > 0 and not eof:
+            capture_output(wait=remaining)
+            remaining = deadline - time.monotonic()
+
+    # Wait for the initial render event-driven: the selector wakes as
+    # soon as the first frame arrives instead of sleeping a guessed 100ms
+    capture_output(wait=1.0)
+
+    # Execute the scripted actions. Delays and post-keystroke waits are
+    # spent inside the selector, so frames are timestamped when they
+    # arrive rather than after an unconditional sleep.
+    for action in actions:
+        if isinstance(action, tuple):
+            delay, keys = action
+            if delay > 0:
+                capture_until(time.monotonic() + delay)
+            if keys:
+                os.write(master, keys)
+                capture_output(wait=0.05)
+
+    # Reap the child with WNOHANG between PTY drains: exit is noticed at
+    # hangup latency rather than a fixed timeout, and a crashed child is
+    # handled the same way. Force-kill only if still alive at the deadline.
+    deadline = time.monotonic() + 3
+    reaped = False
+    while time.monotonic() < deadline:
+        try:
+            wpid, _ = os.waitpid(pid, os.WNOHANG)
+        except ChildProcessError:
+            reaped = True
+            break
+        if wpid:
+            reaped = True
+            break
+        if eof:
+            time.sleep(0.001)
+        else:
+            capture_output(wait=0.01)
+    if not reaped:
+        try:
+            os.kill(pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+        try:
+            os.waitpid(pid, 0)
+        except ChildProcessError:
+            pass
+    # Pick up anything written between the last drain and exit
+    capture_output(wait=0)
+
+    if not fast_binary:
+        # Flush any bytes still buffered in the decoder
+        tail = dec.decode(b"", final=True)
+        if tail:
+            t = round((time.monotonic_ns() - start_ns) / 1e9, 6)
+            f.write(json.dumps([t, "o", tail]) + "\n")
+
+    sel.close()
+    fio.close()
+    os.close(master)
+    f.close()
+
+    if fast_binary:
+        ttyrec_to_cast(ttyrec_path, cast_path, header)
+
+    compress_cast(cast_path)
 
     print(f"    Saved {cast_path}")
     return cast_path
@@ -135,23 +375,92 @@ def cast_to_gif(name):
     cast_path = os.path.join(EXAMPLES_DIR, f"{name}.cast")
     gif_path = os.path.join(EXAMPLES_DIR, f"{name}.gif")
 
+    # Skip the encode when the cast is byte-identical to the previous
+    # run; encoding is by far the most expensive step per example
+    with open(cast_path, "rb") as f:
+        digest = hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+    sha_path = cast_path + ".sha"
+    if os.path.exists(gif_path) and os.path.exists(sha_path):
+        with open(sha_path) as f:
+            if f.read().strip() == digest:
+                print(f"  Skipping {name} (cast unchanged)")
+                return
+
     print(f"  Converting {name} to GIF...")
 
     agg_bin = os.path.expanduser("~/.cargo/bin/agg")
-    ret = os.system(
-        f'{agg_bin} --font-size 14 --theme dracula '
-        f'"{cast_path}" "{gif_path}" 2>&1'
-    )
-
-    if ret == 0 and os.path.exists(gif_path):
+    # List argv (no shell fork, no quoting); let agg skip idle stretches
+    # and cap the frame rate so rendering stays bounded
+    try:
+        result = subprocess.run(
+            [
+                agg_bin,
+                "--font-size", "14",
+                "--theme", "dracula",
+                "--idle-time-limit", "0.5",
+                "--fps-cap", "30",
+                cast_path,
+                gif_path,
+            ],
+            check=False,
+        )
+        returncode = result.returncode
+    except FileNotFoundError:
+        # agg not installed; os.system used to surface this as a
+        # nonzero exit rather than an exception
+        returncode = 1
+
+    if returncode == 0 and os.path.exists(gif_path):
+        with open(sha_path, "w") as f:
+            f.write(digest + "\n")
         size_kb = os.path.getsize(gif_path) / 1024
         print(f"    Created {gif_path} ({size_kb:.0f} KB)")
     else:
         print(f"    ERROR: Failed to create GIF for {name}")
 
 
+def cast_to_svg(name):
+    """Convert asciicast to an animated SVG using svg-term.
+
+    SVG emission is O(events) text diffing, orders of magnitude cheaper
+    than agg's per-frame rasterization, and the output files are far
+    smaller than GIFs.
+    """
+    cast_path = os.path.join(EXAMPLES_DIR, f"{name}.cast")
+    svg_path = os.path.join(EXAMPLES_DIR, f"{name}.svg")
+    ex = EXAMPLES.get(name, {})
+
+    print(f"  Converting {name} to SVG...")
+
+    try:
+        result = subprocess.run(
+            [
+                "svg-term",
+                "--in", cast_path,
+                "--out", svg_path,
+                "--width", str(ex.get("cols", DEFAULT_COLS)),
+                "--height", str(ex.get("rows", DEFAULT_ROWS)),
+            ],
+            check=False,
+        )
+        returncode = result.returncode
+    except FileNotFoundError:
+        # svg-term not on PATH (possible with an explicit --svg run)
+        returncode = 1
+
+    if returncode == 0 and os.path.exists(svg_path):
+        size_kb = os.path.getsize(svg_path) / 1024
+        print(f"    Created {svg_path} ({size_kb:.0f} KB)")
+    else:
+        print(f"    ERROR: Failed to create SVG for {name}")
+
+
 # ── Example definitions ─────────────────────────────────────────────
 
+# Typed sequences for example8, built once at import
+TYPE_HELLO = [(0.08, c) for c in "Hello, BasementUI!"]
+TYPE_WORLD = [(0.08, c) for c in "World!"]
+
 EXAMPLES = {
     "example1": {
         "command": "go run cmd/example1_hello/main.go",
@@ -210,12 +519,12 @@ EXAMPLES = {
         "command": "go run cmd/example8_textinput/main.go",
         "actions": [
             (1.5, None),
-        ] + [(0.08, c) for c in "Hello, BasementUI!"] + [
+        ] + TYPE_HELLO + [
             (1.5, None),
             (0.15, BACKSPACE), (0.15, BACKSPACE), (0.15, BACKSPACE),
             (0.15, BACKSPACE), (0.15, BACKSPACE),
             (0.8, None),
-        ] + [(0.08, c) for c in "World!"] + [
+        ] + TYPE_WORLD + [
             (1.5, None),
             (0, ESC),
         ],
@@ -268,47 +577,132 @@ EXAMPLES = {
 }
 
 
+# Keystrokes following another keystroke by less than this are sent in
+# the same write; the TUIs read runes in order, so batching is safe
+KEY_COALESCE_EPS = 0.01
+
+
+def _normalize(examples):
+    """Pre-encode every action key string to bytes, once at import.
+
+    The send loop then writes keys straight to the PTY with no
+    per-keystroke isinstance branch or encode call. Adjacent keystrokes
+    separated by a near-zero delay are folded into a single write.
+    """
+    for ex in examples.values():
+        merged = []
+        for delay, keys in ex["actions"]:
+            if isinstance(keys, str):
+                keys = keys.encode("utf-8")
+            if merged and keys and merged[-1][1] and delay < KEY_COALESCE_EPS:
+                merged[-1] = (merged[-1][0], merged[-1][1] + keys)
+            else:
+                merged.append((delay, keys))
+        ex["actions"] = merged
+    return examples
+
+
+EXAMPLES = _normalize(EXAMPLES)
+
+
+def record_one(name, bin_path):
+    """Record a single example in a worker process.
+
+    Returns (name, cast_path) so the parent can run the GIF conversion
+    once the cast is on disk. Each worker owns its own PTY and output
+    file, so recordings are fully independent.
+    """
+    ex = EXAMPLES[name]
+    rows = ex.get("rows", DEFAULT_ROWS)
+    cols = ex.get("cols", DEFAULT_COLS)
+
+    print(f"\n{'='*50}")
+    print(f"Recording {name} (rows={rows})")
+    print(f"{'='*50}")
+
+    try:
+        # Spawn first so the Go runtime warms up while we set up recording
+        pid, master = spawn_example(bin_path, cols=cols, rows=rows)
+        cast_path = record_cast(name, pid, master, ex["actions"], cols=cols, rows=rows)
+        return name, cast_path
+    except Exception as e:
+        print(f"  ERROR recording {name}: {e}")
+        import traceback
+        traceback.print_exc()
+        return name, None
+
+
 def main():
     os.makedirs(EXAMPLES_DIR, exist_ok=True)
 
-    # Allow specifying which examples to record
-    targets = sys.argv[1:] if len(sys.argv) > 1 else list(EXAMPLES.keys())
+    # Keep the Go build cache in the repo so warm re-runs only recompile
+    # changed packages; BIN_DIR is wiped at the end, this is not
+    os.environ.setdefault("GOCACHE", os.path.join(PROJ_DIR, ".go-cache"))
+
+    # Allow specifying which examples to record, plus --svg / --gif to
+    # pick the output format (SVG preferred when svg-term is installed)
+    args = sys.argv[1:]
+    flags = {a for a in args if a.startswith("--")}
+    targets = [a for a in args if not a.startswith("--")] or list(EXAMPLES.keys())
+
+    if "--gif" in flags:
+        convert = cast_to_gif
+    elif "--svg" in flags or shutil.which("svg-term"):
+        convert = cast_to_svg
+    else:
+        convert = cast_to_gif
 
     print("Pre-building all example binaries...\n")
 
-    # Build all targeted examples as binaries
-    bin_paths = {}
+    valid = []
     for name in targets:
         if name not in EXAMPLES:
             print(f"Unknown example: {name}")
             continue
-        bp = build_example(name, EXAMPLES[name]["command"])
-        if bp:
-            bin_paths[name] = bp
+        valid.append(name)
+    targets = valid
 
-    print()
-
-    for name in targets:
-        if name not in bin_paths:
-            continue
+    bin_paths = build_examples(targets)
 
-        ex = EXAMPLES[name]
-        rows = ex.get("rows", DEFAULT_ROWS)
-        
-        print(f"\n{'='*50}")
-        print(f"Recording {name} (rows={rows})")
-        print(f"{'='*50}")
+    print()
 
-        try:
-            record_cast(name, bin_paths[name], ex["actions"], rows=rows)
-            cast_to_gif(name)
-        except Exception as e:
-            print(f"  ERROR recording {name}: {e}")
-            import traceback
-            traceback.print_exc()
+    # Record independent examples concurrently: the dominant cost per
+    # recording is scripted sleep time, so running them in parallel
+    # collapses wall-clock time to roughly the longest single example.
+    # Processes (not threads) so each child owns its own PTY fds.
+    to_record = [name for name in targets if name in bin_paths]
+    if to_record:
+        # Convert finished casts on a dedicated thread so recording
+        # workers are never waited on behind GIF encoding; agg runs in
+        # its own subprocess, so the GIL does not matter here
+        gif_q = queue.Queue()
+
+        def gif_worker():
+            for gif_name in iter(gif_q.get, None):
+                try:
+                    convert(gif_name)
+                except Exception as e:
+                    # One bad cast must not discard the rest of the batch
+                    print(f"  ERROR converting {gif_name}: {e}")
+
+        gif_thread = threading.Thread(target=gif_worker, daemon=True)
+        gif_thread.start()
+
+        workers = min(len(to_record), os.cpu_count() or 1)
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(record_one, name, bin_paths[name])
+                for name in to_record
+            ]
+            for fut in concurrent.futures.as_completed(futures):
+                name, cast_path = fut.result()
+                if cast_path:
+                    gif_q.put(name)
+
+        gif_q.put(None)
+        gif_thread.join()
 
     # Cleanup binaries
-    import shutil
     if os.path.exists(BIN_DIR):
         shutil.rmtree(BIN_DIR)
 